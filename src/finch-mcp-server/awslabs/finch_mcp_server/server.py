@@ -20,6 +20,8 @@ Note: The tools provided by this MCP server are intended for development and pro
 purposes only and are not meant for production use cases.
 """
 
+import asyncio
+import functools
 import os
 import re
 import sys
@@ -27,7 +29,11 @@ from awslabs.finch_mcp_server.consts import SERVER_NAME
 
 # Import Pydantic models for input validation
 from awslabs.finch_mcp_server.models import Result
-from awslabs.finch_mcp_server.utils.build import build_image, contains_ecr_reference
+from awslabs.finch_mcp_server.utils.build import (
+    build_image,
+    contains_ecr_reference,
+    read_ecr_reference,
+)
 from awslabs.finch_mcp_server.utils.common import format_result
 from awslabs.finch_mcp_server.utils.ecr import create_ecr_repository
 
@@ -118,6 +124,9 @@ def configure_logging(server_name: str = 'finch-mcp-server'):
                     rotation='10 MB',
                     retention='7 days',
                     compression='gz',
+                    # Write, rotate and compress on loguru's worker thread so tool calls
+                    # never wait on disk I/O
+                    enqueue=True,
                 )
                 # Log initialization message to ensure file gets created
                 logger.info('File logging initialized successfully')
@@ -137,6 +146,155 @@ def configure_logging(server_name: str = 'finch-mcp-server'):
     return bound_logger
 
 
+# Keys whose values are redacted. 'oauth_token' is listed before 'token' so the longer key wins.
+_SECRET_KEYS = r'api[_-]?key|password|secret|oauth[_-]?token|token|credentials?'
+
+# Matches every secret key and its separator in one pass. Used when the trigger scan's
+# offsets cannot be reused; _splice_key_values then redacts the value after each key.
+_KEY_PATTERN = re.compile(rf'(?:{_SECRET_KEYS})[=:]', re.IGNORECASE)
+
+# Case-sensitive detector for every pattern that has a literal anchor, searched against the
+# case-folded message so the common no-match path avoids case-insensitive matching. A single
+# scan reports which pattern families are present through the name of the matching group.
+# A URL only needs redacting when an '@' follows the scheme separator within the same token.
+_TRIGGER_PATTERN = re.compile(
+    rf'(?P<key_value>(?:{_SECRET_KEYS})[=:])|(?P<url>://(?=[^@\s]+@))|(?P<jwt>eyj)'
+)
+
+# A literal that every _TRIGGER_PATTERN match must contain. Substring searches run in C at
+# memory speed, whereas the regex tries its alternatives at every common letter, so these
+# rule out most messages before the trigger scan runs.
+_TRIGGER_LITERALS = ('key', 'password', 'secret', 'token', 'credential', '://', 'eyj')
+
+
+# Patterns for sensitive data detection, compiled once at import. Each entry names the
+# _TRIGGER_PATTERN group that must be found before the pattern is worth running; the AWS key
+# patterns have no literal anchor and are instead triggered by the message being at least as
+# long as the key. Patterns whose character classes are pure ASCII are compiled with
+# re.ASCII to skip Unicode handling; they never match non-ASCII text either way.
+#
+# The AWS key patterns run before any key=value secret is redacted. The URL and JWT patterns
+# run after the other key=value secrets but before credentials, the order the original
+# per-pattern substitutions used; a credential's value could otherwise swallow the start of a
+# URL and hide its credentials from the URL pattern.
+_AWS_KEY_PATTERNS = [
+    # AWS Access Key (20 character alphanumeric with a known key-type prefix). The prefix
+    # comes first so the regex engine can search for the literal; the lookbehind then
+    # checks the character preceding it.
+    (
+        'aws_access_key',
+        re.compile(
+            r'(?:AKIA|ASIA|AROA)(?<![A-Z0-9]....)[A-Z0-9]{16}(?![A-Z0-9])',
+            re.ASCII,
+        ),
+        'AWS_ACCESS_KEY_REDACTED',
+    ),
+    # AWS Secret Key (40 character base64)
+    (
+        'aws_secret',
+        re.compile(r'((?<![A-Za-z0-9/+=])[A-Za-z0-9/+=]{40}(?![A-Za-z0-9/+=]))', re.ASCII),
+        'AWS_SECRET_KEY_REDACTED',
+    ),
+]
+
+_SENSITIVE_PATTERNS = [
+    # URLs with credentials
+    (
+        'url',
+        re.compile(r'(https?://)([^:@\s]+):([^:@\s]+)@'),
+        r'\1REDACTED:REDACTED@',
+    ),
+    # JWT tokens (common format)
+    (
+        'jwt',
+        re.compile(r'eyJ[a-zA-Z0-9_-]{5,}\.eyJ[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}', re.ASCII),
+        'JWT_TOKEN_REDACTED',
+    ),
+]
+
+
+# Key set in a record's "extra" dict once its message has been redacted
+_REDACTED_MARKER = '_sensitive_data_redacted'
+
+
+# Value following a detected key and its separator. Group 1 ends where the value starts and
+# group 2 holds the optional closing quote.
+_VALUE_PATTERN = re.compile(r'(\s*[\'"]?)[^\'"\s]+([\'"]?)')
+
+
+def _fold_case(text):
+    """Fold the case of text the way re.IGNORECASE matches it against the secret keys.
+
+    Besides ASCII letters, re.IGNORECASE treats 'ſ' as 's', the Kelvin sign as 'k', and both
+    'İ' and 'ı' as 'i'. casefold() covers the first two; 'İ' folds to two characters, which
+    callers detect by the change in length, and 'ı' is mapped by hand.
+    """
+    if text.isascii():
+        return text.lower()
+    return text.casefold().replace('ı', 'i')
+
+
+def _redact_patterns(message, patterns, triggers):
+    """Apply each pattern whose trigger was found.
+
+    Args:
+        message: The log message to redact
+        patterns: (trigger, pattern, replacement) entries to apply in order
+        triggers: Names of the triggers found in the message
+
+    Returns:
+        tuple: The redacted message and the number of substitutions made
+
+    """
+    redactions = 0
+    for trigger, pattern, replacement in patterns:
+        if trigger in triggers:
+            redacted, count = pattern.subn(replacement, message)
+            if count:
+                message = redacted
+                redactions += count
+    return message, redactions
+
+
+def _key_value_replacement(key, prefix, closing_quote):
+    """Return the redacted text for a secret value following the given key."""
+    key = _fold_case(key)
+    if key.startswith('api'):
+        return 'api_key=REDACTED'
+    if key in ('password', 'secret'):
+        return f'{key}=REDACTED'
+    # Tokens and credentials keep their original key and quoting
+    return f'{prefix}REDACTED{closing_quote}'
+
+
+def _splice_key_values(message, key_spans):
+    """Redact the value after each detected key without rescanning the whole message.
+
+    Keys are handled from last to first. A key found inside an earlier key's value is then
+    redacted before that value is matched, so the earlier value swallows the redacted text
+    just as it did when each key had its own substitution.
+
+    Args:
+        message: The log message to redact
+        key_spans: (start, end) offsets of each key and its separator, in message order
+
+    Returns:
+        tuple: The redacted message and the number of values redacted
+
+    """
+    redactions = 0
+    for start, end in reversed(key_spans):
+        value = _VALUE_PATTERN.match(message, end)
+        if value is None:
+            continue
+        replacement = _key_value_replacement(
+            message[start : end - 1], message[start : value.end(1)], value.group(2)
+        )
+        message = message[:start] + replacement + message[value.end() :]
+        redactions += 1
+    return message, redactions
+
+
 def sensitive_data_filter(record):
     """Filter that redacts sensitive information from log messages.
 
@@ -150,59 +308,71 @@ def sensitive_data_filter(record):
         bool: True to allow the log record to be processed, False to filter it out
 
     """
-    # Define patterns for sensitive data detection
-    patterns = [
-        # AWS Access Key (20 character alphanumeric)
-        (re.compile(r'((?<![A-Z0-9])[A-Z0-9]{20}(?![A-Z0-9]))'), 'AWS_ACCESS_KEY_REDACTED'),
-        # AWS Secret Key (40 character base64)
-        (
-            re.compile(r'((?<![A-Za-z0-9/+=])[A-Za-z0-9/+=]{40}(?![A-Za-z0-9/+=]))'),
-            'AWS_SECRET_KEY_REDACTED',
-        ),
-        # API Keys
-        (
-            re.compile(r'(api[_-]?key[=:]\s*[\'"]?)[^\'"\s]+([\'"]?)', re.IGNORECASE),
-            r'api_key=REDACTED',
-        ),
-        # Passwords
-        (
-            re.compile(r'(password[=:]\s*[\'"]?)[^\'"\s]+([\'"]?)', re.IGNORECASE),
-            r'password=REDACTED',
-        ),
-        # Secrets
-        (
-            re.compile(r'(secret[=:]\s*[\'"]?)[^\'"\s]+([\'"]?)', re.IGNORECASE),
-            r'secret=REDACTED',
-        ),
-        # Tokens
-        (re.compile(r'(token[=:]\s*[\'"]?)[^\'"\s]+([\'"]?)', re.IGNORECASE), r'\1REDACTED\2'),
-        # URLs with credentials
-        (re.compile(r'(https?://)([^:@\s]+):([^:@\s]+)@'), r'\1REDACTED:REDACTED@'),
-        # JWT tokens (common format)
-        (
-            re.compile(r'eyJ[a-zA-Z0-9_-]{5,}\.eyJ[a-zA-Z0-9_-]{5,}\.[a-zA-Z0-9_-]{5,}'),
-            'JWT_TOKEN_REDACTED',
-        ),
-        # OAuth tokens
-        (
-            re.compile(r'(oauth[_-]?token[=:]\s*[\'"]?)[^\'"\s]+([\'"]?)', re.IGNORECASE),
-            r'\1REDACTED\2',
-        ),
-        # Generic credentials
-        (
-            re.compile(r'(credential[s]?[=:]\s*[\'"]?)[^\'"\s]+([\'"]?)', re.IGNORECASE),
-            r'\1REDACTED\2',
-        ),
-    ]
+    # Every sink shares this filter and loguru hands each of them the same record dict. Loguru
+    # already skips the filter for records below a sink's level, so the remaining duplicate
+    # work is redacting the same message once per sink; mark the record after the first pass.
+    extra = record.get('extra')
+    if extra is not None and extra.get(_REDACTED_MARKER):
+        return True
 
     try:
         if 'message' in record:
             message = record['message']
-
-            for pattern, replacement in patterns:
-                message = pattern.sub(replacement, message)
-
-            record['message'] = message
+            # Triggers are far cheaper than the full patterns, and most log lines contain
+            # none of the trigger keywords.
+            lowered = _fold_case(message)
+            triggers = set()
+            key_spans = []
+            if any(literal in lowered for literal in _TRIGGER_LITERALS):
+                for match in _TRIGGER_PATTERN.finditer(lowered):
+                    if match.lastgroup == 'key_value':
+                        key_spans.append(match.span())
+                    else:
+                        triggers.add(match.lastgroup)
+            # Short messages, such as most tool-name and status lines, cannot hold an AWS key
+            if len(message) >= 20:
+                triggers.add('aws_access_key')
+                if len(message) >= 40:
+                    triggers.add('aws_secret')
+
+            # 'İ' folds to two characters, which shifts the trigger scan's offsets and can hide
+            # a key from it altogether: 'apİ_key' folds to 'api' + U+0307 + '_key'.
+            offsets_shifted = len(lowered) != len(message)
+
+            message, redactions = _redact_patterns(message, _AWS_KEY_PATTERNS, triggers)
+
+            # API keys, passwords, secrets, tokens and OAuth tokens are redacted at the key
+            # offsets the trigger scan already found. Those offsets only carry over while case
+            # folding and AWS key redaction left every character in place; otherwise the keys
+            # are found again in the working message.
+            if offsets_shifted or (key_spans and redactions):
+                key_spans = [match.span() for match in _KEY_PATTERN.finditer(message)]
+            credential_spans = [span for span in key_spans if message[span[0]] in 'cC']
+            if len(credential_spans) < len(key_spans):
+                other_spans = [span for span in key_spans if message[span[0]] not in 'cC']
+                message, count = _splice_key_values(message, other_spans)
+                redactions += count
+
+            message, count = _redact_patterns(message, _SENSITIVE_PATTERNS, triggers)
+            redactions += count
+
+            # Generic credentials come last, found again if anything before moved them
+            if credential_spans:
+                if redactions:
+                    credential_spans = [
+                        match.span()
+                        for match in _KEY_PATTERN.finditer(message)
+                        if message[match.start()] in 'cC'
+                    ]
+                message, count = _splice_key_values(message, credential_spans)
+                redactions += count
+
+            # Most messages contain nothing to redact; leave the record untouched for those
+            if redactions:
+                record['message'] = message
+
+        if extra is not None:
+            extra[_REDACTED_MARKER] = True
 
     except Exception as e:
         if 'message' in record:
@@ -224,10 +394,61 @@ logger.remove()
 logger.add(sys.stderr, level='INFO', filter=sensitive_data_filter)
 logger = logger.bind(name=SERVER_NAME)
 
+# Logger for fixed literal messages that can never contain secrets. Its records carry the
+# redaction marker from the start, so sensitive_data_filter passes them through untouched.
+literal_logger = logger.bind(**{_REDACTED_MARKER: True})
+
 # Initialize the MCP server
 mcp = FastMCP(SERVER_NAME)
 enable_aws_resource_write = False
 
+# The platform cannot change while the server runs, and Finch has no VM to manage on Linux
+_IS_LINUX = sys.platform == 'linux'
+
+# Fixed ensure_vm_running outcomes, built once instead of on every tool call
+_LINUX_NOOP_RESULT = format_result('success', 'Finch does not use a VM on Linux..')
+_VM_INITIALIZED_RESULT = format_result('success', 'Finch VM was initialized successfully.')
+_VM_STARTED_RESULT = format_result('success', 'Finch VM was started successfully.')
+_VM_RUNNING_RESULT = format_result('success', 'Finch VM is already running.')
+
+# Held while a tool call configures ECR login, restarts the VM or brings it up. Those steps
+# read and write shared state (finch.yaml and the VM itself), so concurrent calls take turns
+# through them; the build, push and repository calls that follow still run in parallel.
+_vm_setup_lock = asyncio.Lock()
+
+# Agents tend to push the same image names repeatedly, and the result only depends on the name
+is_ecr_repository = functools.lru_cache(maxsize=256)(is_ecr_repository)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_contains_ecr_reference(dockerfile_path: str, mtime_ns: int, size: int) -> bool:
+    """Scan a Dockerfile for ECR references, memoized on its modification time and size.
+
+    Read errors propagate instead of being turned into False, so lru_cache does not keep
+    them and a later call reads the file again.
+    """
+    return read_ecr_reference(dockerfile_path)
+
+
+def _dockerfile_contains_ecr_reference(dockerfile_path: str) -> bool:
+    """Check a Dockerfile for ECR references, reusing the result while the file is unchanged.
+
+    Args:
+        dockerfile_path: Path to the Dockerfile to check
+
+    Returns:
+        bool: True if the Dockerfile contains ECR references, False otherwise
+
+    """
+    try:
+        stat_result = os.stat(dockerfile_path)
+        return _cached_contains_ecr_reference(
+            dockerfile_path, stat_result.st_mtime_ns, stat_result.st_size
+        )
+    except (OSError, UnicodeDecodeError):
+        # Let contains_ecr_reference report the missing or unreadable file
+        return contains_ecr_reference(dockerfile_path)
+
 
 def ensure_vm_running() -> Dict[str, Any]:
     """Ensure that the Finch VM is running before performing operations.
@@ -245,26 +466,26 @@ def ensure_vm_running() -> Dict[str, Any]:
 
     """
     try:
-        if sys.platform == 'linux':
-            logger.info('Linux OS detected. Finch does not use a VM on Linux...')
-            return format_result('success', 'Finch does not use a VM on Linux..')
+        if _IS_LINUX:
+            literal_logger.info('Linux OS detected. Finch does not use a VM on Linux...')
+            return _LINUX_NOOP_RESULT
 
         status_result = get_vm_status()
 
         if is_vm_nonexistent(status_result):
-            logger.info('Finch VM does not exist. Initializing...')
+            literal_logger.info('Finch VM does not exist. Initializing...')
             result = initialize_vm()
             if result['status'] == 'error':
                 return result
-            return format_result('success', 'Finch VM was initialized successfully.')
+            return _VM_INITIALIZED_RESULT
         elif is_vm_stopped(status_result):
-            logger.info('Finch VM is stopped. Starting it...')
+            literal_logger.info('Finch VM is stopped. Starting it...')
             result = start_stopped_vm()
             if result['status'] == 'error':
                 return result
-            return format_result('success', 'Finch VM was started successfully.')
+            return _VM_STARTED_RESULT
         elif is_vm_running(status_result):
-            return format_result('success', 'Finch VM is already running.')
+            return _VM_RUNNING_RESULT
         else:
             return format_result(
                 'error',
@@ -317,28 +538,30 @@ async def finch_build_container_image(
         Result(status="success", message="Successfully built image from /path/to/Dockerfile")
 
     """
-    logger.info('tool-name: finch_build_container_image')
-    logger.info(f'tool-args: dockerfile_path={dockerfile_path}, context_path={context_path}')
+    literal_logger.info('tool-name: finch_build_container_image')
+    logger.info('tool-args: dockerfile_path={}, context_path={}', dockerfile_path, context_path)
 
     try:
-        finch_install_status = check_finch_installation()
+        finch_install_status = await asyncio.to_thread(check_finch_installation)
         if finch_install_status['status'] == 'error':
             return Result(**finch_install_status)
 
-        if contains_ecr_reference(dockerfile_path):
-            logger.info('ECR reference detected in Dockerfile, configuring ECR login')
-            config_result, config_changed = configure_ecr()
-            if config_result['status'] == 'error':
-                return Result(**config_result)
-            if config_changed:
-                logger.info('ECR configuration changed, restarting VM')
-                stop_vm(force=True)
-
-        vm_status = ensure_vm_running()
+        async with _vm_setup_lock:
+            if _dockerfile_contains_ecr_reference(dockerfile_path):
+                literal_logger.info('ECR reference detected in Dockerfile, configuring ECR login')
+                config_result, config_changed = await asyncio.to_thread(configure_ecr)
+                if config_result['status'] == 'error':
+                    return Result(**config_result)
+                if config_changed:
+                    literal_logger.info('ECR configuration changed, restarting VM')
+                    await asyncio.to_thread(stop_vm, force=True)
+
+            vm_status = await asyncio.to_thread(ensure_vm_running)
         if vm_status['status'] == 'error':
             return Result(**vm_status)
 
-        result = build_image(
+        result = await asyncio.to_thread(
+            build_image,
             dockerfile_path=dockerfile_path,
             context_path=context_path,
             tags=tags,
@@ -387,39 +610,40 @@ async def finch_push_image(
         Result(status="success", message="Successfully pushed image 123456789012.dkr.ecr.us-west-2.amazonaws.com/my-repo:abcdef123456 to ECR.")
 
     """
-    logger.info('tool-name: finch_push_image')
-    logger.info(f'tool-args: image={image}')
+    literal_logger.info('tool-name: finch_push_image')
+    logger.info('tool-args: image={}', image)
 
     try:
-        finch_install_status = check_finch_installation()
+        finch_install_status = await asyncio.to_thread(check_finch_installation)
         if finch_install_status['status'] == 'error':
             return Result(**finch_install_status)
 
         is_ecr = is_ecr_repository(image)
-        if is_ecr:
-            # Check if AWS resource write is enabled for ECR pushes
-            if not enable_aws_resource_write:
-                logger.warning(
-                    f'Attempt to push image to ECR "{image}" without AWS resource write enabled'
-                )
-                error_result = format_result(
-                    'error', 'Server running in read-only mode, unable to push to ECR repository'
-                )
-                return Result(**error_result)
-
-            logger.info('ECR repository detected, configuring ECR login')
-            config_result, config_changed = configure_ecr()
-            if config_result['status'] == 'error':
-                return Result(**config_result)
-            if config_changed:
-                logger.info('ECR configuration changed, restarting VM')
-                stop_vm(force=True)
-
-        vm_status = ensure_vm_running()
+        # Check if AWS resource write is enabled for ECR pushes
+        if is_ecr and not enable_aws_resource_write:
+            logger.warning(
+                'Attempt to push image to ECR "{}" without AWS resource write enabled', image
+            )
+            error_result = format_result(
+                'error', 'Server running in read-only mode, unable to push to ECR repository'
+            )
+            return Result(**error_result)
+
+        async with _vm_setup_lock:
+            if is_ecr:
+                literal_logger.info('ECR repository detected, configuring ECR login')
+                config_result, config_changed = await asyncio.to_thread(configure_ecr)
+                if config_result['status'] == 'error':
+                    return Result(**config_result)
+                if config_changed:
+                    literal_logger.info('ECR configuration changed, restarting VM')
+                    await asyncio.to_thread(stop_vm, force=True)
+
+            vm_status = await asyncio.to_thread(ensure_vm_running)
         if vm_status['status'] == 'error':
             return Result(**vm_status)
 
-        result = push_image(image)
+        result = await asyncio.to_thread(push_image, image)
         return Result(**result)
     except Exception as e:
         error_result = format_result('error', f'Error pushing image: {str(e)}')
@@ -471,13 +695,13 @@ async def finch_create_ecr_repo(
                exists=False)
 
     """
-    logger.info('tool-name: finch_create_ecr_repo')
-    logger.info(f'tool-args: repository_name={repository_name}')
+    literal_logger.info('tool-name: finch_create_ecr_repo')
+    logger.info('tool-args: repository_name={}', repository_name)
 
     # Check if AWS resource write is enabled
     if not enable_aws_resource_write:
         logger.warning(
-            f'Attempt to create ECR repo "{repository_name}" without AWS resource write enabled'
+            'Attempt to create ECR repo "{}" without AWS resource write enabled', repository_name
         )
         error_result = format_result(
             'error', 'Server running in read-only mode, unable to perform the action'
@@ -485,7 +709,8 @@ async def finch_create_ecr_repo(
         return Result(**error_result)
 
     try:
-        result = create_ecr_repository(
+        result = await asyncio.to_thread(
+            create_ecr_repository,
             repository_name=repository_name,
             region=region,
         )
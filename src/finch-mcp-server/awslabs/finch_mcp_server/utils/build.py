@@ -29,6 +29,27 @@ from loguru import logger
 from typing import Any, Dict, List, Optional
 
 
+def read_ecr_reference(dockerfile_path: str) -> bool:
+    """Read a Dockerfile and check whether it references an ECR repository.
+
+    Unlike contains_ecr_reference, read errors are raised to the caller instead of being
+    reported as no reference.
+
+    Args:
+        dockerfile_path (str): Path to the Dockerfile to check.
+
+    Returns:
+        bool: True if the Dockerfile contains ECR references, False otherwise.
+
+    Raises:
+        OSError: If the Dockerfile cannot be opened or read.
+        UnicodeDecodeError: If the Dockerfile is not valid text.
+
+    """
+    with open(dockerfile_path, 'r') as f:
+        return bool(re.search(ECR_REFERENCE_PATTERN, f.read()))
+
+
 def contains_ecr_reference(dockerfile_path: str) -> bool:
     """Check if a Dockerfile contains references to ECR repositories.
 
@@ -47,9 +68,7 @@ def contains_ecr_reference(dockerfile_path: str) -> bool:
             logger.warning(f'Dockerfile not found at {dockerfile_path}')
             return False
 
-        with open(dockerfile_path, 'r') as f:
-            content = f.read()
-            return bool(re.search(ECR_REFERENCE_PATTERN, content))
+        return read_ecr_reference(dockerfile_path)
     except Exception as e:
         logger.error(f'Error checking Dockerfile for ECR references: {str(e)}')
         return False
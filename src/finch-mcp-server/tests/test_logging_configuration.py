@@ -50,6 +50,14 @@ class TestLoggingConfiguration:
         second_call = mock_logger.add.call_args_list[1]
         assert isinstance(second_call[0][0], str)  # file path
 
+    @patch('awslabs.finch_mcp_server.server.logger')
+    def test_file_logging_is_enqueued(self, mock_logger):
+        """Test that the file sink writes from a background worker."""
+        configure_logging()
+
+        file_call = mock_logger.add.call_args_list[1]
+        assert file_call[1]['enqueue'] is True
+
     @patch.dict(os.environ, {'FINCH_DISABLE_FILE_LOGGING': 'true'})
     @patch('awslabs.finch_mcp_server.server.logger')
     def test_disabled_file_logging_via_env(self, mock_logger):
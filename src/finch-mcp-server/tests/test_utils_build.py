@@ -1,7 +1,12 @@
 """Tests for the build utility module."""
 
+import pytest
 from awslabs.finch_mcp_server.consts import STATUS_ERROR, STATUS_SUCCESS
-from awslabs.finch_mcp_server.utils.build import build_image, contains_ecr_reference
+from awslabs.finch_mcp_server.utils.build import (
+    build_image,
+    contains_ecr_reference,
+    read_ecr_reference,
+)
 from unittest.mock import MagicMock, mock_open, patch
 
 
@@ -62,6 +67,26 @@ class TestContainsEcrReference:
         mock_file.assert_called_once_with('/path/to/Dockerfile', 'r')
 
 
+class TestReadEcrReference:
+    """Tests for the read_ecr_reference function."""
+
+    @patch(
+        'builtins.open',
+        new_callable=mock_open,
+        read_data='FROM 123456789012.dkr.ecr.us-west-2.amazonaws.com/base:latest',
+    )
+    def test_read_ecr_reference_true(self, mock_file):
+        """Test that ECR reference is detected correctly."""
+        assert read_ecr_reference('/path/to/Dockerfile') is True
+        mock_file.assert_called_once_with('/path/to/Dockerfile', 'r')
+
+    @patch('builtins.open', side_effect=PermissionError('Permission denied'))
+    def test_read_ecr_reference_raises_read_error(self, mock_file):
+        """Test that read errors are raised rather than reported as no reference."""
+        with pytest.raises(PermissionError):
+            read_ecr_reference('/path/to/Dockerfile')
+
+
 class TestBuildImage:
     """Tests for the build_image function."""
 